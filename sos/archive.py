@@ -15,6 +15,7 @@ import shutil
 import logging
 import codecs
 import errno
+import hashlib
 import stat
 import re
 from datetime import datetime
@@ -38,6 +39,22 @@ P_DIR = "dir"
 P_CONTFILE = "contaner file"
 
 
+class _ChecksumWriter:
+    """Write-through file object that hashes everything written to it, so
+    that the archive does not need to be read back to be checksummed."""
+
+    def __init__(self, fileobj, hash_name):
+        self._fileobj = fileobj
+        self.digest = hashlib.new(hash_name)
+
+    def write(self, data):
+        self.digest.update(data)
+        return self._fileobj.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
+
+
 class Archive:
     """Abstract base class for archives."""
 
@@ -51,6 +68,8 @@ class Archive:
 
     _name = "unset"
     _debug = False
+    _checksum = None
+    _checksum_name = None
 
     _path_lock = Lock()
 
@@ -77,6 +96,19 @@ class Archive:
     def name(self):
         return self._name
 
+    def set_checksum_name(self, hash_name):
+        """Request that finalize() checksums the archive with the hashlib
+        algorithm hash_name while writing it, see get_checksum()."""
+        self._checksum_name = hash_name
+
+    def get_checksum(self, hash_name):
+        """Return the hex digest of the finalized archive computed while it
+        was written, or None if it is not available or was not computed with
+        hash_name, in which case the caller should hash the archive itself."""
+        if hash_name != self._checksum_name:
+            return None
+        return self._checksum
+
     # this is our contract to clients of the Archive class hierarchy.
     # All sub-classes need to implement these methods (or inherit concrete
     # implementations from a parent class.
@@ -617,7 +649,10 @@ class FileCacheArchive(Archive):
 
         if self.enc_opts['encrypt']:
             try:
-                return self._encrypt(res)
+                enc_res = self._encrypt(res)
+                # the digest was taken over the unencrypted archive
+                self._checksum = None
+                return enc_res
             except Exception as e:
                 exp_msg = "An error occurred encrypting the archive:"
                 self.log_error(f"{exp_msg} {e}")
@@ -744,22 +779,26 @@ class TarFileArchive(FileCacheArchive):
             'gzip': {'compresslevel': 6},
             'xz':   {'preset': 3}
         }
-        with tarfile.open(self._archive_name,
-                          mode=_mode,
-                          **kwargs[method]) as tar:
-            # Add commonly reviewed files first, so that they can be more
-            # easily read from memory without needing to extract
-            # the whole archive
-            for _content in ['version.txt', 'sos_reports', 'sos_logs']:
-                if os.path.exists(os.path.join(self._archive_root, _content)):
-                    tar.add(
-                        os.path.join(self._archive_root, _content),
-                        arcname=f"{self._name}/{_content}"
-                    )
-            # we need to pass the absolute path to the archive root but we
-            # want the names used in the archive to be relative.
-            tar.add(self._archive_root, arcname=self._name,
-                    filter=self.copy_permissions_filter)
+        with open(self._archive_name, 'wb') as archive_fp:
+            checksum_fp = None
+            if self._checksum_name:
+                checksum_fp = _ChecksumWriter(archive_fp, self._checksum_name)
+            with tarfile.open(fileobj=checksum_fp or archive_fp,
+                              mode=_mode,
+                              **kwargs[method]) as tar:
+                # Add commonly reviewed files first, so that they can be more
+                # easily read from memory without needing to extract
+                # the whole archive
+                for _content in ['version.txt', 'sos_reports', 'sos_logs']:
+                    _path = os.path.join(self._archive_root, _content)
+                    if os.path.exists(_path):
+                        tar.add(_path, arcname=f"{self._name}/{_content}")
+                # we need to pass the absolute path to the archive root but we
+                # want the names used in the archive to be relative.
+                tar.add(self._archive_root, arcname=self._name,
+                        filter=self.copy_permissions_filter)
+        if checksum_fp:
+            self._checksum = checksum_fp.digest.hexdigest()
         return self.name()
 
 
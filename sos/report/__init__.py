@@ -19,15 +19,20 @@ import hashlib
 import pdb
 from datetime import datetime
 import glob
+import itertools
+import mmap
 
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
+from pathlib import Path
 from shutil import rmtree
+from threading import Lock
 
 import sos.report.plugins
 from sos.utilities import (ImporterHelper, SoSTimeoutError, bold,
                            sos_get_command_output, TIMEOUT_DEFAULT, listdir,
-                           is_executable, scrub_url_credential)
+                           is_executable, scrub_url_credential,
+                           get_human_readable)
 
 from sos import _sos as _
 from sos import __version__
@@ -42,6 +47,10 @@ from sos.upload import SoSUpload
 # file system errors that should terminate a run
 fatal_fs_errors = (errno.ENOSPC, errno.EROFS)
 
+# largest archive we will mmap for checksumming; 32-bit hosts rarely have a
+# contiguous 2GiB of free address space, so stay well below that there
+mmap_hash_limit = 1024**3 if sys.maxsize <= 2**32 else 1024**4
+
 
 def _format_list(first_line, items, indent=False, sep=", "):
     lines = []
@@ -162,6 +171,8 @@ class SoSReport(SoSComponent):
         self._args = args
         self.sysroot = "/"
         self.estimated_plugsizes = {}
+        self._last_progress = None
+        self._progress_lock = Lock()
 
         self.print_header()
         self._set_debug()
@@ -800,8 +811,6 @@ class SoSReport(SoSComponent):
         only_plugins = self.opts.only_plugins
         if not self.opts.profiles:
             return True
-        if not hasattr(plugin_class, "profiles"):
-            return False
         if only_plugins and not self._is_not_specified(plugin_class.name()):
             return True
         return any(p in self.opts.profiles for p in plugin_class.profiles)
@@ -836,6 +845,25 @@ class SoSReport(SoSComponent):
             plugin_class(self.get_commons())
         ))
 
+    def _get_named_plugins(self):
+        """Return the set of plugin module names that need to be imported, or
+        None if every plugin module must be imported.
+
+        With --only-plugins and no profiles every other plugin would end up
+        skipped as "not specified" (matched by module name), so only the
+        plugins named on the command line need importing, unless we need
+        every plugin to list plugins or profiles. Names are stripped of any
+        ".option" suffix the same way _check_for_unknown_plugins() does.
+        """
+        if (not self.opts.only_plugins or self.opts.profiles or
+                self.opts.list_plugins or self.opts.list_profiles):
+            return None
+        return {
+            plugin.split(".")[0] for plugin in itertools.chain(
+                self.opts.only_plugins, self.opts.skip_plugins,
+                self.opts.enable_plugins)
+        }
+
     def load_plugins(self):
         import_plugin = sos.report.plugins.import_plugin
         helper = ImporterHelper(sos.report.plugins)
@@ -852,9 +880,13 @@ class SoSReport(SoSComponent):
         validate_plugin = self.policy.validate_plugin
         remaining_profiles = list(self.opts.profiles)
 
+        named_plugins = self._get_named_plugins()
+
         # validate and load plugins
         for plug in plugins:
             plugbase, __ = os.path.splitext(plug)
+            if named_plugins is not None and plugbase not in named_plugins:
+                continue
             try:
                 plugin_classes = import_plugin(plugbase, valid_plugin_classes)
                 if not plugin_classes:
@@ -892,8 +924,7 @@ class SoSReport(SoSComponent):
                     continue
 
                 # only add the plugin's profiles once we know it is usable
-                if hasattr(plugin_class, "profiles"):
-                    self.profiles.update(plugin_class.profiles)
+                self.profiles.update(plugin_class.profiles)
 
                 # true when the null (empty) profile is active
                 default_profile = not using_profiles and in_profile
@@ -982,7 +1013,6 @@ class SoSReport(SoSComponent):
                 self.soslog.error('')
 
     def _check_for_unknown_plugins(self):
-        import itertools
         for plugin in itertools.chain(self.opts.only_plugins,
                                       self.opts.enable_plugins):
             plugin_name = plugin.split(".")[0]
@@ -1430,7 +1460,13 @@ class SoSReport(SoSComponent):
             status_line = f"\r{status_line.ljust(90)}"
         else:
             status_line = f"{status_line}\n"
-        if not self.opts.quiet:
+        if self.opts.quiet:
+            return
+        # plugin threads report progress concurrently
+        with self._progress_lock:
+            if status_line == self._last_progress:
+                return
+            self._last_progress = status_line
             sys.stdout.write(status_line)
             sys.stdout.flush()
 
@@ -1527,17 +1563,46 @@ class SoSReport(SoSComponent):
         if not archive:
             return False
 
+        digest = None
         try:
             hash_size = 1024**2  # Hash 1MiB of content at a time.
-            digest = hashlib.new(hash_name)
             with open(archive, 'rb') as archive_fp:
-                while True:
-                    hashdata = archive_fp.read(hash_size)
-                    if not hashdata:
-                        break
-                    digest.update(hashdata)
+                # let the kernel read ahead of us while we hash each chunk
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(archive_fp.fileno(), 0, 0,
+                                         os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        # only a hint, some filesystems may refuse it
+                        pass
+                # python 3.11+ hashes the file entirely in C
+                if hasattr(hashlib, 'file_digest'):
+                    digest = hashlib.file_digest(archive_fp, hash_name)
+                else:
+                    digest = hashlib.new(hash_name)
+                    hashed = False
+                    size = os.fstat(archive_fp.fileno()).st_size
+                    if 0 < size <= mmap_hash_limit:
+                        # map the archive and hash it with a single update()
+                        try:
+                            with mmap.mmap(archive_fp.fileno(), 0,
+                                           access=mmap.ACCESS_READ) as mapped:
+                                if hasattr(mapped, 'madvise'):
+                                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                                digest.update(mapped)
+                            hashed = True
+                        except (OSError, ValueError, OverflowError):
+                            # could not map it, hash it in chunks instead
+                            digest = hashlib.new(hash_name)
+                    if not hashed:
+                        while True:
+                            hashdata = archive_fp.read(hash_size)
+                            if not hashdata:
+                                break
+                            digest.update(hashdata)
         except Exception:
             self.handle_exception()
+            return False
         return digest.hexdigest()
 
     def _write_checksum(self, archive, hash_name, checksum):
@@ -1595,8 +1660,6 @@ class SoSReport(SoSComponent):
 
         # print results in estimate mode (to include also just added manifest)
         if self.opts.estimate_only:
-            from sos.utilities import get_human_readable
-            from pathlib import Path
             # add sos_logs, sos_reports dirs, etc., basically everything
             # that remained in self.tmpdir after plugins' contents removal
             # that still will be moved to the sos report final directory path
@@ -1629,6 +1692,9 @@ class SoSReport(SoSComponent):
             try:
                 if do_clean:
                     self.archive.rename_archive_root(cleaner)
+                # hash the archive as it is written rather than re-reading it
+                self.archive.set_checksum_name(
+                    self.policy.get_preferred_hash_name())
                 archive = self.archive.finalize(
                     self.opts.compression_type)
             except OSError as e:
@@ -1673,7 +1739,9 @@ class SoSReport(SoSComponent):
                 try:
                     # compute and store the archive checksum
                     hash_name = self.policy.get_preferred_hash_name()
-                    checksum = self._create_checksum(archive, hash_name)
+                    # prefer the digest taken while the archive was written
+                    checksum = (self.archive.get_checksum(hash_name) or
+                                self._create_checksum(archive, hash_name))
                 except Exception:
                     print(_("Error generating archive checksum after "
                             "archive creation.\n"))
@@ -49,6 +49,12 @@ recommended to install proper python3-magic package with the module.
 
 TIMEOUT_DEFAULT = 300
 
+# module lists and class lists are static for the life of a process, so keep
+# them around rather than re-scanning the filesystem or re-inspecting modules
+_importer_module_cache = {}
+_import_class_cache = {}
+_import_failure_cache = {}
+
 __all__ = [
     'TIMEOUT_DEFAULT',
     'ImporterHelper',
@@ -452,16 +458,32 @@ def import_module(module_fqname, superclasses=None):
     from that module. If superclasses is defined then the classes returned will
     be subclasses of the specified superclass or superclasses. If superclasses
     is plural it must be a tuple of classes."""
-    module_name = module_fqname.rpartition(".")[-1]
-    try:
-        module = __import__(module_fqname, globals(), locals(), [module_name])
-    except ImportError as e:
+    if module_fqname in _import_failure_cache:
+        # a failed import is not recorded in sys.modules, so do not pay for
+        # it again on a module we already know is broken on this host
+        err_class, err_msg, err_name = _import_failure_cache[module_fqname]
         print(f'Error while trying to load module {module_fqname}: '
-              f' {e.__class__.__name__}')
-        raise e
-    modules = [class_ for cname, class_ in
-               inspect.getmembers(module, inspect.isclass)
-               if class_.__module__ == module_fqname]
+              f' {err_class}')
+        raise ImportError(err_msg, name=err_name)
+    if module_fqname not in _import_class_cache:
+        module_name = module_fqname.rpartition(".")[-1]
+        try:
+            module = __import__(module_fqname, globals(), locals(),
+                                [module_name])
+        except ImportError as e:
+            print(f'Error while trying to load module {module_fqname}: '
+                  f' {e.__class__.__name__}')
+            # keep only the message, not the exception and its frames
+            _import_failure_cache[module_fqname] = (
+                e.__class__.__name__, str(e), e.name
+            )
+            raise e
+        _import_class_cache[module_fqname] = [
+            class_ for cname, class_ in
+            inspect.getmembers(module, inspect.isclass)
+            if class_.__module__ == module_fqname
+        ]
+    modules = list(_import_class_cache[module_fqname])
     if superclasses:
         modules = [m for m in modules if issubclass(m, superclasses)]
 
@@ -744,12 +766,15 @@ class ImporterHelper:
     def get_modules(self):
         """Returns the list of importable modules in the configured python
         package. """
-        plugins = []
-        for path in self.package.__path__:
-            if os.path.isdir(path):
-                plugins.extend(self._find_plugins_in_dir(path))
-
-        return plugins
+        key = (self.package.__name__, tuple(self.package.__path__))
+        if key not in _importer_module_cache:
+            plugins = []
+            for path in self.package.__path__:
+                if os.path.isdir(path):
+                    plugins.extend(self._find_plugins_in_dir(path))
+            _importer_module_cache[key] = plugins
+
+        return list(_importer_module_cache[key])
 
 
 class TempFileUtil():
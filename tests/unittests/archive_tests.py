@@ -6,6 +6,7 @@
 #
 # See the LICENSE file in the source distribution for further information.
 import unittest
+import hashlib
 import os
 import tarfile
 import tempfile
@@ -113,6 +114,19 @@ class TarFileArchiveTest(unittest.TestCase):
     def test_compress(self):
         self.tf.finalize("auto")
 
+    def test_checksum(self):
+        self.tf.add_file('tests/unittests/ziptest')
+        self.tf.set_checksum_name('sha256')
+        archive = self.tf.finalize('auto')
+        with open(archive, 'rb') as archive_fp:
+            expected = hashlib.sha256(archive_fp.read()).hexdigest()
+        self.assertEqual(self.tf.get_checksum('sha256'), expected)
+        self.assertIsNone(self.tf.get_checksum('sha512'))
+
+    def test_checksum_not_requested(self):
+        self.tf.finalize('auto')
+        self.assertIsNone(self.tf.get_checksum('sha256'))
+
 
 if __name__ == "__main__":
     unittest.main()
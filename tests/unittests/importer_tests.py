@@ -5,9 +5,12 @@
 # version 2 of the GNU General Public License.
 #
 # See the LICENSE file in the source distribution for further information.
+import builtins
 import unittest
+from unittest.mock import patch
 
-from sos.utilities import ImporterHelper
+from sos.archive import TarFileArchive
+from sos.utilities import ImporterHelper, import_module
 
 
 class ImporterHelperTests(unittest.TestCase):
@@ -17,6 +20,46 @@ class ImporterHelperTests(unittest.TestCase):
         modules = h.get_modules()
         self.assertTrue('main' in modules)
 
+    def test_modules_cached(self):
+        ImporterHelper(unittest).get_modules()
+        with patch.object(ImporterHelper, '_find_plugins_in_dir') as find:
+            modules = ImporterHelper(unittest).get_modules()
+            find.assert_not_called()
+        self.assertTrue('main' in modules)
+
+    def test_modules_cache_returns_copy(self):
+        modules = ImporterHelper(unittest).get_modules()
+        modules.append('not_a_module')
+        self.assertNotIn('not_a_module',
+                         ImporterHelper(unittest).get_modules())
+
+    def test_import_module_classes_copy(self):
+        classes = import_module('sos.archive')
+        self.assertIn(TarFileArchive, classes)
+        classes.remove(TarFileArchive)
+        self.assertIn(TarFileArchive, import_module('sos.archive'))
+
+    def test_import_module_failure_cached(self):
+        real_import = builtins.__import__
+        with patch('builtins.__import__', side_effect=real_import) as imp, \
+                patch('builtins.print'):
+            for __ in range(2):
+                with self.assertRaises(ImportError) as err:
+                    import_module('sos.no_such_module')
+                self.assertEqual(err.exception.name, 'sos.no_such_module')
+        attempts = [c for c in imp.call_args_list
+                    if c.args[0] == 'sos.no_such_module']
+        self.assertEqual(len(attempts), 1)
+
+    def test_import_module_failure_keeps_name(self):
+        missing = ModuleNotFoundError("No module named 'dep'", name='dep')
+        with patch('builtins.__import__', side_effect=missing), \
+                patch('builtins.print'):
+            for __ in range(2):
+                with self.assertRaises(ImportError) as err:
+                    import_module('sos.broken_module')
+                self.assertEqual(err.exception.name, 'dep')
+
 
 if __name__ == "__main__":
     unittest.main()
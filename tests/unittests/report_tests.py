@@ -6,6 +6,7 @@
 #
 # See the LICENSE file in the source distribution for further information.
 import unittest
+from argparse import Namespace
 
 try:
     import json
@@ -14,6 +15,7 @@ except ImportError:
 
 from sos.report.reporting import (Report, Section, Command, CopiedFile,
                                   CreatedFile, Alert, PlainTextReport)
+from sos.report import SoSReport
 
 
 class ReportTest(unittest.TestCase):
@@ -149,6 +151,40 @@ class TestPlainReport(unittest.TestCase):
             PlainTextReport(self.report).unicode())
 
 
+class NamedPluginsTest(unittest.TestCase):
+
+    def named_plugins(self, **opts):
+        defaults = {
+            'only_plugins': [], 'skip_plugins': [], 'enable_plugins': [],
+            'profiles': [], 'list_plugins': False, 'list_profiles': False
+        }
+        defaults.update(opts)
+        report = SoSReport.__new__(SoSReport)
+        report.opts = Namespace(**defaults)
+        return report._get_named_plugins()
+
+    def test_no_only_plugins(self):
+        self.assertIsNone(self.named_plugins(enable_plugins=['kernel']))
+
+    def test_only_plugins(self):
+        self.assertEqual(
+            self.named_plugins(only_plugins=['kernel'],
+                               enable_plugins=['networking.foo'],
+                               skip_plugins=['host']),
+            {'kernel', 'networking', 'host'}
+        )
+
+    def test_only_plugins_with_profiles(self):
+        self.assertIsNone(self.named_plugins(only_plugins=['kernel'],
+                                             profiles=['system']))
+
+    def test_only_plugins_listing(self):
+        self.assertIsNone(self.named_plugins(only_plugins=['kernel'],
+                                             list_plugins=True))
+        self.assertIsNone(self.named_plugins(only_plugins=['kernel'],
+                                             list_profiles=True))
+
+
 if __name__ == "__main__":
     unittest.main()
 